@@ -0,0 +1,54 @@
+"""JSON helpers – use orjson when it is installed, fall back to the stdlib."""
+
+from __future__ import annotations
+
+import json
+from dataclasses import fields, is_dataclass
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one alias
+# catches decode errors from either backend.
+JSONDecodeError = json.JSONDecodeError
+
+if orjson is not None:
+    loads = orjson.loads
+
+    def dumps(obj: Any, *, indent: bool = False, newline: bool = False) -> bytes:
+        """Serialize *obj* (dataclasses included) to UTF-8 JSON bytes.
+
+        With *newline* a trailing ``\n`` is appended by the encoder itself,
+        ready to be written as a JSONL record.
+        """
+        option = orjson.OPT_INDENT_2 if indent else 0
+        if newline:
+            option |= orjson.OPT_APPEND_NEWLINE
+        return orjson.dumps(obj, option=option or None)
+
+else:
+    loads = json.loads
+
+    def _default(obj: Any) -> Any:
+        # Shallow field mapping; json recurses into the values itself, so
+        # there is no deep copy as with dataclasses.asdict.
+        if is_dataclass(obj) and not isinstance(obj, type):
+            return {f.name: getattr(obj, f.name) for f in fields(obj)}
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    def dumps(obj: Any, *, indent: bool = False, newline: bool = False) -> bytes:
+        """Serialize *obj* (dataclasses included) to UTF-8 JSON bytes.
+
+        With *newline* a trailing ``\n`` is appended, ready to be written
+        as a JSONL record.
+        """
+        if indent:
+            text = json.dumps(obj, indent=2, ensure_ascii=False, default=_default)
+        else:
+            text = json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=_default)
+        if newline:
+            text += "\n"
+        return text.encode()
@@ -2,15 +2,32 @@
 
 from __future__ import annotations
 
-import json
+import heapq
 import logging
+from collections.abc import Iterator
 from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import islice
+from operator import attrgetter
 from pathlib import Path
+from sys import intern
+from typing import Any
+
+from .. import _json
 
 logger = logging.getLogger(__name__)
 
+_by_timestamp = attrgetter("timestamp")
+
+
+def _intern(value: Any) -> Any:
+    # Event types, models, metric names and units take a handful of
+    # distinct values across a whole trace; interning makes every record
+    # share one string object instead of holding a fresh decoded copy.
+    return intern(value) if type(value) is str else value
 
-@dataclass
+
+@dataclass(slots=True)
 class OpenClawEvent:
     """Parsed OpenClaw diagnostic event from log files."""
 
@@ -28,10 +45,11 @@ class OpenClawEvent:
     cost_usd: float = 0.0
     status: str = "ok"
     error: str = ""
-    raw: dict = field(default_factory=dict)
+    # Original JSON object; only kept when parsing with ``keep_raw=True``.
+    raw: dict | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceSample:
     """Parsed resource metric sample."""
 
@@ -42,100 +60,166 @@ class ResourceSample:
     labels: dict[str, str] = field(default_factory=dict)
 
 
-def parse_openclaw_log(path: str | Path) -> list[OpenClawEvent]:
-    """Parse an OpenClaw JSONL log file and extract diagnostic events.
+def _iter_jsonl_bytes(path: Path, bufsize: int = 262144) -> Iterator[bytes]:
+    """Yield the non-empty lines of a JSONL file as stripped ``bytes``.
+
+    The file is read in *bufsize* chunks and split on ``\\n`` in C, which
+    avoids the per-line overhead of iterating a file object.
+    """
+    tail = b""
+    with open(path, "rb") as fh:
+        while True:
+            chunk = fh.read(bufsize)
+            if not chunk:
+                break
+            lines = (tail + chunk).split(b"\n")
+            tail = lines.pop()
+            for line in lines:
+                line = line.strip()
+                if line:
+                    yield line
+    tail = tail.strip()
+    if tail:
+        yield tail
+
+
+def iter_openclaw_log(path: str | Path, *, keep_raw: bool = False) -> Iterator[OpenClawEvent]:
+    """Stream diagnostic events from an OpenClaw JSONL log file.
 
     Looks for log lines that contain OpenClaw diagnostic event markers
-    (``model.usage``, ``webhook.*``, ``message.*``, etc.).
+    (``model.usage``, ``webhook.*``, ``message.*``, etc.).  Events are
+    yielded in file order.  The decoded JSON object is attached as
+    ``raw`` only when *keep_raw* is set, since holding it roughly doubles
+    the memory used per event.
     """
-    events: list[OpenClawEvent] = []
     path = Path(path)
     if not path.exists():
         logger.warning("OpenClaw log file not found: %s", path)
-        return events
-
-    with open(path, encoding="utf-8") as fh:
-        for line in fh:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                obj = json.loads(line)
-            except json.JSONDecodeError:
-                continue
+        return
 
-            evt_type = obj.get("type") or obj.get("event_type") or ""
-            if not evt_type:
-                # look for OTel-style span names
-                evt_type = obj.get("name", "")
+    for line in _iter_jsonl_bytes(path):
+        # Lines without any event-type key are dropped below anyway; a
+        # substring probe on the raw bytes is far cheaper than decoding.
+        if b'"type"' not in line and b'"event_type"' not in line and b'"name"' not in line:
+            continue
+        try:
+            obj = _json.loads(line)
+        except _json.JSONDecodeError:
+            continue
 
-            if not evt_type:
-                continue
+        # The schema is fixed, so each key (and its fallback) is probed
+        # once through a bound ``get`` rather than via nested .get defaults.
+        g = obj.get
+        # OTel-style span names are the last resort for the event type
+        evt_type = g("type") or g("event_type") or g("name")
+        if not evt_type:
+            continue
 
-            ts = obj.get("timestamp") or obj.get("time") or 0
-            if isinstance(ts, str):
-                from datetime import datetime, timezone
+        ts = g("timestamp") or g("time") or 0
+        if isinstance(ts, str):
+            # Epoch seconds serialized as a string are the common case;
+            # only fall back to the ISO-8601 parser when that fails.
+            try:
+                ts = float(ts)
+            except ValueError:
                 try:
                     ts = datetime.fromisoformat(ts).timestamp()
                 except ValueError:
-                    ts = 0
-
-            usage = obj.get("usage", {})
-            event = OpenClawEvent(
-                timestamp=float(ts),
-                event_type=evt_type,
-                channel=obj.get("channel", ""),
-                provider=obj.get("provider", ""),
-                model=obj.get("model", ""),
-                session_key=obj.get("sessionKey", ""),
-                session_id=obj.get("sessionId", ""),
-                duration_ms=float(obj.get("durationMs", obj.get("duration_ms", 0))),
-                tokens_input=int(usage.get("input", 0)),
-                tokens_output=int(usage.get("output", 0)),
-                tokens_total=int(usage.get("total", 0)),
-                cost_usd=float(obj.get("costUsd", obj.get("cost_usd", 0))),
-                status="error" if obj.get("error") else "ok",
-                error=str(obj.get("error", "")),
-                raw=obj,
-            )
-            events.append(event)
-
-    events.sort(key=lambda e: e.timestamp)
+                    ts = 0.0
+
+        duration = g("durationMs")
+        if duration is None:
+            duration = g("duration_ms", 0)
+        cost = g("costUsd")
+        if cost is None:
+            cost = g("cost_usd", 0)
+        error = g("error")
+        usage = g("usage") or {}
+        ug = usage.get
+        tokens_input = int(ug("input", 0))
+        tokens_output = int(ug("output", 0))
+        tokens_total = ug("total")
+        # OpenClaw may omit the total; it is then input + output
+        tokens_total = tokens_input + tokens_output if tokens_total is None else int(tokens_total)
+
+        yield OpenClawEvent(
+            timestamp=float(ts),
+            event_type=_intern(evt_type),
+            channel=_intern(g("channel", "")),
+            provider=_intern(g("provider", "")),
+            model=_intern(g("model", "")),
+            session_key=_intern(g("sessionKey", "")),
+            session_id=_intern(g("sessionId", "")),
+            duration_ms=float(duration),
+            tokens_input=tokens_input,
+            tokens_output=tokens_output,
+            tokens_total=tokens_total,
+            cost_usd=float(cost),
+            status="error" if error else "ok",
+            error="" if error is None else str(error),
+            raw=obj if keep_raw else None,
+        )
+
+
+def parse_openclaw_log(path: str | Path, *, keep_raw: bool = False) -> list[OpenClawEvent]:
+    """Parse an OpenClaw JSONL log file into a timestamp-sorted event list."""
+    events = list(iter_openclaw_log(path, keep_raw=keep_raw))
+    events.sort(key=_by_timestamp)
     return events
 
 
-def parse_resource_file(path: str | Path) -> list[ResourceSample]:
-    """Parse a local JSONL resource file produced by trace_claw."""
-    samples: list[ResourceSample] = []
+def iter_resource_file(path: str | Path) -> Iterator[ResourceSample]:
+    """Stream samples from a local JSONL resource file produced by trace_claw."""
     path = Path(path)
     if not path.exists():
         logger.warning("Resource file not found: %s", path)
-        return samples
+        return
+
+    # A file repeats the same few label sets (one per pid, core or
+    # interface) on every tick; samples with equal labels share one dict.
+    # The shared dicts must be treated as read-only.
+    shared_labels: dict[tuple, dict[str, Any]] = {}
+    for line in _iter_jsonl_bytes(path):
+        try:
+            obj = _json.loads(line)
+        except _json.JSONDecodeError:
+            continue
+        labels = obj.get("labels", {})
+        try:
+            labels = shared_labels.setdefault(tuple(labels.items()), labels)
+        except (AttributeError, TypeError):
+            pass  # not a flat mapping of hashable values; keep as parsed
+        yield ResourceSample(
+            timestamp=float(obj.get("timestamp", 0)),
+            name=_intern(obj.get("name", "")),
+            value=float(obj.get("value", 0)),
+            unit=_intern(obj.get("unit", "")),
+            labels=labels,
+        )
 
-    with open(path, encoding="utf-8") as fh:
-        for line in fh:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                obj = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            samples.append(ResourceSample(
-                timestamp=float(obj.get("timestamp", 0)),
-                name=obj.get("name", ""),
-                value=float(obj.get("value", 0)),
-                unit=obj.get("unit", ""),
-                labels=obj.get("labels", {}),
-            ))
-    return samples
+
+def parse_resource_file(path: str | Path) -> list[ResourceSample]:
+    """Parse a local JSONL resource file produced by trace_claw."""
+    return list(iter_resource_file(path))
+
+
+def _trace_files(trace_dir: Path) -> tuple[list[Path], list[Path]]:
+    """Split the ``*.jsonl`` files in *trace_dir* into (event, resource) paths."""
+    event_paths: list[Path] = []
+    resource_paths: list[Path] = []
+    for fp in sorted(trace_dir.glob("*.jsonl")):
+        if "resource" in fp.stem.lower():
+            resource_paths.append(fp)
+        else:
+            event_paths.append(fp)
+    return event_paths, resource_paths
 
 
 def load_trace_dir(trace_dir: str | Path) -> tuple[list[OpenClawEvent], list[ResourceSample]]:
     """Load all trace and resource data from a directory.
 
-    Scans for ``*.jsonl`` files and classifies them as OpenClaw events
-    (filenames containing ``openclaw``) or resource samples.
+    Scans for ``*.jsonl`` files and classifies them as resource samples
+    (filenames containing ``resource``) or OpenClaw events.
     """
     trace_dir = Path(trace_dir)
     events: list[OpenClawEvent] = []
@@ -145,12 +229,46 @@ def load_trace_dir(trace_dir: str | Path) -> tuple[list[OpenClawEvent], list[Res
         logger.warning("Trace directory does not exist: %s", trace_dir)
         return events, resources
 
-    for fp in sorted(trace_dir.glob("*.jsonl")):
-        if "resource" in fp.stem.lower():
-            resources.extend(parse_resource_file(fp))
-        else:
-            events.extend(parse_openclaw_log(fp))
+    event_paths, resource_paths = _trace_files(trace_dir)
+    for fp in event_paths:
+        events.extend(parse_openclaw_log(fp))
+    for fp in resource_paths:
+        resources.extend(parse_resource_file(fp))
 
-    events.sort(key=lambda e: e.timestamp)
-    resources.sort(key=lambda r: r.timestamp)
+    # Each file contributes an already-sorted run; list.sort detects and
+    # merges those runs in C, which beats heapq.merge's Python-level merge.
+    events.sort(key=_by_timestamp)
+    resources.sort(key=_by_timestamp)
     return events, resources
+
+
+def iter_trace_dir(
+    trace_dir: str | Path,
+    chunksize: int = 50_000,
+) -> Iterator[tuple[list[OpenClawEvent], list[ResourceSample]]]:
+    """Stream a trace directory as ``(events_chunk, resources_chunk)`` tuples.
+
+    Unlike :func:`load_trace_dir`, at most *chunksize* events and
+    *chunksize* resource samples are held in memory at a time.  Files are
+    merged with :func:`heapq.merge`, so each file is expected to be in
+    timestamp order already (as files appended by trace_claw and OpenClaw
+    are); the combined stream is then globally ordered without a sort.
+    Once one stream is exhausted its side of the tuple is an empty list.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be >= 1")
+    trace_dir = Path(trace_dir)
+    if not trace_dir.exists():
+        logger.warning("Trace directory does not exist: %s", trace_dir)
+        return
+
+    event_paths, resource_paths = _trace_files(trace_dir)
+    event_iter = heapq.merge(*(iter_openclaw_log(fp) for fp in event_paths), key=_by_timestamp)
+    resource_iter = heapq.merge(*(iter_resource_file(fp) for fp in resource_paths), key=_by_timestamp)
+
+    while True:
+        events_chunk = list(islice(event_iter, chunksize))
+        resources_chunk = list(islice(resource_iter, chunksize))
+        if not events_chunk and not resources_chunk:
+            return
+        yield events_chunk, resources_chunk
@@ -2,15 +2,15 @@
 
 from __future__ import annotations
 
-import json
 import statistics
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from pathlib import Path
 
+from .. import _json
 from .parser import OpenClawEvent, ResourceSample
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionSummary:
     """Summary statistics for a single tracing session."""
 
@@ -45,7 +45,7 @@ class SessionSummary:
     max_process_rss_bytes: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class MultiSessionSummary:
     """Aggregate summary across multiple sessions."""
 
@@ -59,15 +59,47 @@ class MultiSessionSummary:
     sessions: list[SessionSummary] = field(default_factory=list)
 
 
-def _percentile(data: list[float], pct: float) -> float:
-    if not data:
-        return 0.0
-    sorted_data = sorted(data)
-    idx = (pct / 100.0) * (len(sorted_data) - 1)
-    low = int(idx)
-    high = min(low + 1, len(sorted_data) - 1)
-    frac = idx - low
-    return sorted_data[low] * (1 - frac) + sorted_data[high] * frac
+# (metric name, average field, max field) summarised per session
+_RESOURCE_STATS: tuple[tuple[str, str, str], ...] = (
+    ("system.cpu.usage_percent", "avg_cpu_percent", "max_cpu_percent"),
+    ("system.memory.usage_percent", "avg_memory_percent", "max_memory_percent"),
+    ("system.network.bytes_recv_rate", "avg_network_recv_rate", "max_network_recv_rate"),
+    ("process.cpu.usage_percent", "avg_process_cpu_percent", "max_process_cpu_percent"),
+    ("process.memory.rss_bytes", "avg_process_rss_bytes", "max_process_rss_bytes"),
+)
+
+
+def _bucket_resources(resources: list[ResourceSample]) -> dict[str, list[float]]:
+    """Group sample values by metric name in a single pass.
+
+    Only metrics listed in ``_RESOURCE_STATS`` are kept, and system CPU
+    samples are restricted to the ``cpu=total`` series.
+    """
+    buckets: dict[str, list[float]] = {name: [] for name, _, _ in _RESOURCE_STATS}
+    get_bucket = buckets.get
+    for r in resources:
+        vals = get_bucket(r.name)
+        if vals is None:
+            continue
+        if r.name == "system.cpu.usage_percent" and r.labels.get("cpu") != "total":
+            continue
+        vals.append(r.value)
+    return buckets
+
+
+def _percentiles(sorted_data: list[float], pcts: tuple[float, ...]) -> list[float]:
+    """Linearly interpolated percentiles of already-sorted *sorted_data*."""
+    if not sorted_data:
+        return [0.0] * len(pcts)
+    last = len(sorted_data) - 1
+    out: list[float] = []
+    for pct in pcts:
+        idx = (pct / 100.0) * last
+        low = int(idx)
+        high = min(low + 1, last)
+        frac = idx - low
+        out.append(sorted_data[low] * (1 - frac) + sorted_data[high] * frac)
+    return out
 
 
 def summarize_session(
@@ -86,17 +118,22 @@ def summarize_session(
         summary.end_time = events[-1].timestamp
         summary.total_duration_ms = (summary.end_time - summary.start_time) * 1000
 
+        # Accumulate in locals and assign once at the end; updating the
+        # summary's attributes per event dominates the loop on large traces.
         latencies: list[float] = []
         models: set[str] = set()
         providers: set[str] = set()
+        model_calls = tokens_input = tokens_output = tokens_total = 0
+        cost_usd = 0.0
+        error_count = 0
 
         for evt in events:
             if evt.event_type == "model.usage":
-                summary.model_calls += 1
-                summary.total_tokens_input += evt.tokens_input
-                summary.total_tokens_output += evt.tokens_output
-                summary.total_tokens += evt.tokens_total
-                summary.total_cost_usd += evt.cost_usd
+                model_calls += 1
+                tokens_input += evt.tokens_input
+                tokens_output += evt.tokens_output
+                tokens_total += evt.tokens_total
+                cost_usd += evt.cost_usd
                 if evt.duration_ms > 0:
                     latencies.append(evt.duration_ms)
                 if evt.model:
@@ -104,14 +141,25 @@ def summarize_session(
                 if evt.provider:
                     providers.add(evt.provider)
             if evt.status == "error":
-                summary.error_count += 1
+                error_count += 1
+
+        summary.model_calls = model_calls
+        summary.total_tokens_input = tokens_input
+        summary.total_tokens_output = tokens_output
+        summary.total_tokens = tokens_total
+        summary.total_cost_usd = cost_usd
+        summary.error_count = error_count
 
         if latencies:
-            summary.avg_latency_ms = statistics.mean(latencies)
-            summary.p50_latency_ms = _percentile(latencies, 50)
-            summary.p95_latency_ms = _percentile(latencies, 95)
-            summary.p99_latency_ms = _percentile(latencies, 99)
-            summary.max_latency_ms = max(latencies)
+            # sort once and read p50/p95/p99 and the max off the same list
+            latencies.sort()
+            summary.avg_latency_ms = statistics.fmean(latencies)
+            (
+                summary.p50_latency_ms,
+                summary.p95_latency_ms,
+                summary.p99_latency_ms,
+            ) = _percentiles(latencies, (50, 95, 99))
+            summary.max_latency_ms = latencies[-1]
 
         if summary.event_count > 0:
             summary.error_rate = summary.error_count / summary.event_count
@@ -119,31 +167,13 @@ def summarize_session(
         summary.models_used = sorted(models)
         summary.providers_used = sorted(providers)
 
-    # resource stats
-    cpu_vals = [r.value for r in resources
-                if r.name == "system.cpu.usage_percent" and r.labels.get("cpu") == "total"]
-    mem_vals = [r.value for r in resources if r.name == "system.memory.usage_percent"]
-    net_recv = [r.value for r in resources if r.name == "system.network.bytes_recv_rate"]
-
-    if cpu_vals:
-        summary.avg_cpu_percent = statistics.mean(cpu_vals)
-        summary.max_cpu_percent = max(cpu_vals)
-    if mem_vals:
-        summary.avg_memory_percent = statistics.mean(mem_vals)
-        summary.max_memory_percent = max(mem_vals)
-    if net_recv:
-        summary.avg_network_recv_rate = statistics.mean(net_recv)
-        summary.max_network_recv_rate = max(net_recv)
-
-    # per-process resource stats
-    proc_cpu = [r.value for r in resources if r.name == "process.cpu.usage_percent"]
-    proc_rss = [r.value for r in resources if r.name == "process.memory.rss_bytes"]
-    if proc_cpu:
-        summary.avg_process_cpu_percent = statistics.mean(proc_cpu)
-        summary.max_process_cpu_percent = max(proc_cpu)
-    if proc_rss:
-        summary.avg_process_rss_bytes = statistics.mean(proc_rss)
-        summary.max_process_rss_bytes = max(proc_rss)
+    # resource stats (system + per-process)
+    buckets = _bucket_resources(resources)
+    for name, avg_attr, max_attr in _RESOURCE_STATS:
+        vals = buckets[name]
+        if vals:
+            setattr(summary, avg_attr, statistics.fmean(vals))
+            setattr(summary, max_attr, max(vals))
 
     return summary
 
@@ -175,5 +205,6 @@ def save_summary(summary: SessionSummary | MultiSessionSummary, path: str | Path
     """Write summary to a JSON file."""
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as fh:
-        json.dump(asdict(summary), fh, indent=2)
+    with open(path, "wb") as fh:
+        # dataclasses serialize natively; no asdict() deep copy needed
+        fh.write(_json.dumps(summary, indent=True))
@@ -2,14 +2,32 @@
 
 from __future__ import annotations
 
-import json
+import sys
 from dataclasses import dataclass, field
+from operator import attrgetter
 from pathlib import Path
 
+from .. import _json
 from .parser import OpenClawEvent, ResourceSample
 
 
-@dataclass
+# Timeline category of a resource metric, keyed by the first two dotted
+# components of its name ("system.cpu.usage_percent" -> "system", "cpu").
+_CATEGORY_BY_HEAD: dict[str, dict[str, str]] = {
+    "system": {"cpu": "cpu", "memory": "memory", "swap": "memory", "network": "network"},
+    "process": {"cpu": "process", "memory": "process", "io": "process"},
+}
+_NO_CATEGORY: dict[str, str] = {}
+
+_timestamp_of = attrgetter("timestamp")
+
+
+def _resource_category(name: str) -> str:
+    head, _, tail = name.partition(".")
+    return _CATEGORY_BY_HEAD.get(head, _NO_CATEGORY).get(tail.partition(".")[0], "resource")
+
+
+@dataclass(slots=True)
 class TimelineEntry:
     """A single row in the unified timeline."""
 
@@ -37,99 +55,163 @@ def build_timeline(
     if not events and not resources:
         return []
 
-    # determine global start time
-    timestamps = [e.timestamp for e in events] + [r.timestamp for r in resources]
-    t0 = min(timestamps)
-
-    entries: list[TimelineEntry] = []
+    # determine global start time without materializing a combined list
+    inf = float("inf")
+    t0 = min(
+        min(map(_timestamp_of, events), default=inf),
+        min(map(_timestamp_of, resources), default=inf),
+    )
+
+    # The final size is known up front, so fill a pre-sized list by index
+    # instead of growing it with append.
+    n_events = len(events)
+    entries: list[TimelineEntry] = [None] * (n_events + len(resources))  # type: ignore[list-item]
+
+    # OpenClaw events.  Each field is loaded into a local once per event;
+    # several of them are read more than once below.
+    for i, evt in enumerate(events):
+        ts = evt.timestamp
+        event_type = evt.event_type
+        model = evt.model
+        duration = evt.duration_ms
+        tokens_total = evt.tokens_total
+        cost = evt.cost_usd
+        error = evt.error
 
-    # OpenClaw events
-    for evt in events:
-        label_parts = [evt.event_type]
-        if evt.model:
-            label_parts.append(evt.model)
         details: dict = {}
-        if evt.tokens_total:
-            details["tokens_total"] = evt.tokens_total
+        if tokens_total:
+            details["tokens_total"] = tokens_total
             details["tokens_input"] = evt.tokens_input
             details["tokens_output"] = evt.tokens_output
-        if evt.cost_usd:
-            details["cost_usd"] = evt.cost_usd
-        if evt.error:
-            details["error"] = evt.error
-
-        entries.append(TimelineEntry(
-            timestamp=evt.timestamp,
-            relative_ms=(evt.timestamp - t0) * 1000,
+        if cost:
+            details["cost_usd"] = cost
+        if error:
+            details["error"] = error
+
+        entries[i] = TimelineEntry(
+            timestamp=ts,
+            relative_ms=(ts - t0) * 1000,
             category="openclaw",
-            event_type=evt.event_type,
-            label=" | ".join(label_parts),
-            value=evt.duration_ms,
+            event_type=event_type,
+            label=f"{event_type} | {model}" if model else event_type,
+            value=duration,
             unit="ms",
-            duration_ms=evt.duration_ms,
+            duration_ms=duration,
             status=evt.status,
             details=details,
-        ))
+        )
 
     # Resource samples – group by metric name for cleaner timeline
-    _category_map = {
-        "system.cpu": "cpu",
-        "system.memory": "memory",
-        "system.swap": "memory",
-        "system.network": "network",
-        "process.cpu": "process",
-        "process.memory": "process",
-        "process.io": "process",
-    }
-
-    for sample in resources:
-        category = "resource"
-        for prefix, cat in _category_map.items():
-            if sample.name.startswith(prefix):
-                category = cat
-                break
-        entries.append(TimelineEntry(
-            timestamp=sample.timestamp,
-            relative_ms=(sample.timestamp - t0) * 1000,
+    # A trace carries only a few dozen distinct metric names, so resolve
+    # each name's category once and memoize it for the remaining samples.
+    category_of: dict[str, str] = {}
+    label_of: dict[tuple, str] = {}
+    for i, sample in enumerate(resources, n_events):
+        ts = sample.timestamp
+        name = sample.name
+        labels = sample.labels
+        category = category_of.get(name)
+        if category is None:
+            category = category_of[name] = _resource_category(name)
+        if labels:
+            # Label sets repeat on every tick (one per core, interface, ...),
+            # so render each distinct (name, labels) pair only once.
+            key = (name, tuple(labels.items()))
+            try:
+                label = label_of.get(key)
+            except TypeError:  # unhashable label value
+                key = None
+                label = None
+            if label is None:
+                label = f"{name} ({', '.join(f'{k}={v}' for k, v in labels.items())})"
+                if key is not None:
+                    label_of[key] = label
+        else:
+            label = name
+        entries[i] = TimelineEntry(
+            timestamp=ts,
+            relative_ms=(ts - t0) * 1000,
             category=category,
-            event_type=sample.name,
-            label=f"{sample.name} ({', '.join(f'{k}={v}' for k, v in sample.labels.items())})" if sample.labels else sample.name,
+            event_type=name,
+            label=label,
             value=sample.value,
             unit=sample.unit,
             status="ok",
-        ))
+        )
 
-    entries.sort(key=lambda e: e.timestamp)
+    entries.sort(key=_timestamp_of)
     return entries
 
 
+def _timeline_row(e: TimelineEntry) -> dict:
+    return {
+        "timestamp": e.timestamp,
+        "relative_ms": round(e.relative_ms, 2),
+        "category": e.category,
+        "event_type": e.event_type,
+        "label": e.label,
+        "value": e.value,
+        "unit": e.unit,
+        "duration_ms": e.duration_ms,
+        "status": e.status,
+        "details": e.details,
+    }
+
+
 def save_timeline(entries: list[TimelineEntry], path: str | Path) -> None:
     """Write timeline entries to a JSON file."""
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    rows = [
-        {
-            "timestamp": e.timestamp,
-            "relative_ms": round(e.relative_ms, 2),
-            "category": e.category,
-            "event_type": e.event_type,
-            "label": e.label,
-            "value": e.value,
-            "unit": e.unit,
-            "duration_ms": e.duration_ms,
-            "status": e.status,
-            "details": e.details,
-        }
-        for e in entries
-    ]
-    with open(path, "w", encoding="utf-8") as fh:
-        json.dump(rows, fh, indent=2)
+    rows = [_timeline_row(e) for e in entries]
+    with open(path, "wb") as fh:
+        fh.write(_json.dumps(rows, indent=True))
+
+
+def save_timeline_ndjson(entries: list[TimelineEntry], path: str | Path) -> None:
+    """Write timeline entries as newline-delimited JSON, one entry per line.
+
+    Unlike :func:`save_timeline` this never holds more than one encoded row
+    in memory, so it suits very long timelines.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    dumps = _json.dumps
+    with open(path, "wb", buffering=1 << 20) as fh:
+        write = fh.write
+        for e in entries:
+            write(dumps(_timeline_row(e), newline=True))
+
+
+_TIMELINE_COLUMNS = ("Offset (ms)", "Category", "Event", "Value", "Duration", "Status", "Details")
+
+
+def _row_cells(entry: TimelineEntry) -> tuple[str, ...]:
+    return (
+        f"{entry.relative_ms:.1f}",
+        entry.category,
+        entry.label,
+        f"{entry.value:.2f} {entry.unit}" if entry.value else "",
+        f"{entry.duration_ms:.1f} ms" if entry.duration_ms else "",
+        entry.status,
+        ", ".join(f"{k}={v}" for k, v in entry.details.items()) if entry.details else "",
+    )
 
 
 def print_timeline(entries: list[TimelineEntry], *, max_rows: int = 200) -> None:
-    """Pretty-print a timeline to the terminal using Rich."""
+    """Pretty-print a timeline to the terminal using Rich.
+
+    When stdout is not a terminal, or more than 1000 rows would be shown,
+    plain tab-separated lines are written instead; Rich's per-cell
+    measuring buys nothing for a pipe or a log file.
+    """
+    if min(len(entries), max_rows) > 1000 or not sys.stdout.isatty():
+        _print_plain(entries, max_rows)
+        return
+
     from rich.console import Console
+    from rich.style import Style
     from rich.table import Table
+    from rich.text import Text
 
     table = Table(title="OpenClaw + Resource Timeline", show_lines=True)
     table.add_column("Offset (ms)", justify="right", style="cyan", width=12)
@@ -140,22 +222,28 @@ def print_timeline(entries: list[TimelineEntry], *, max_rows: int = 200) -> None
     table.add_column("Status", width=8)
     table.add_column("Details", width=36)
 
+    # Build every row first, then hand them to Rich.  The error style is a
+    # pre-built Text rather than inline markup, so Rich does not have to
+    # parse a markup string per row.
+    err_style = Style(color="red")
+    add_row = table.add_row
     for entry in entries[:max_rows]:
-        status_style = "red" if entry.status == "error" else ""
-        details_str = ""
-        if entry.details:
-            details_str = ", ".join(f"{k}={v}" for k, v in entry.details.items())
-        table.add_row(
-            f"{entry.relative_ms:.1f}",
-            entry.category,
-            entry.label,
-            f"{entry.value:.2f} {entry.unit}" if entry.value else "",
-            f"{entry.duration_ms:.1f} ms" if entry.duration_ms else "",
-            f"[{status_style}]{entry.status}[/{status_style}]" if status_style else entry.status,
-            details_str,
-        )
+        cells = _row_cells(entry)
+        if entry.status == "error":
+            cells = (*cells[:5], Text(entry.status, style=err_style), cells[6])
+        add_row(*cells)
 
     console = Console()
     console.print(table)
     if len(entries) > max_rows:
         console.print(f"  ... ({len(entries) - max_rows} more entries)")
+
+
+def _print_plain(entries: list[TimelineEntry], max_rows: int) -> None:
+    lines = ["\t".join(_TIMELINE_COLUMNS)]
+    lines.extend("\t".join(_row_cells(entry)) for entry in entries[:max_rows])
+    if len(entries) > max_rows:
+        lines.append(f"  ... ({len(entries) - max_rows} more entries)")
+    lines.append("")
+    # one write for the whole table
+    sys.stdout.write("\n".join(lines))
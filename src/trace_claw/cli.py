@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import argparse
-import json
 import logging
 import signal
 import sys
@@ -11,11 +10,15 @@ import time
 from pathlib import Path
 
 from . import __version__
-from .config import load_config
+
+# Timelines longer than this are written as NDJSON to bound peak memory.
+_NDJSON_TIMELINE_MIN_ENTRIES = 100_000
 
 
 def _cmd_collect(args: argparse.Namespace) -> None:
     """Run system resource collection."""
+    from .config import load_config
+
     cfg = load_config(args.config)
 
     from .collector.manager import CollectorManager
@@ -52,20 +55,27 @@ def _cmd_collect(args: argparse.Namespace) -> None:
         while not stop:
             time.sleep(0.5)
     finally:
-        manager.stop()
+        unfinished = manager.stop()
         for exp in exporters:
+            if exp.export in unfinished:
+                # its sink thread may still call export(); shutting the
+                # exporter down now would drop that batch
+                print(f"{type(exp).__name__} still writing; not shut down", file=sys.stderr)
+                continue
             exp.shutdown()
     print("\nCollection stopped.")
 
 
 def _cmd_analyze(args: argparse.Namespace) -> None:
     """Run trace analysis and print summary."""
+    from .config import load_config
+
     cfg = load_config(args.config)
     trace_dir = args.trace_dir or cfg.analyzer.trace_dir
 
     from .analyzer.parser import load_trace_dir
     from .analyzer.summary import save_summary, summarize_session
-    from .analyzer.timeline import build_timeline, print_timeline, save_timeline
+    from .analyzer.timeline import build_timeline, print_timeline, save_timeline, save_timeline_ndjson
 
     events, resources = load_trace_dir(trace_dir)
 
@@ -93,8 +103,12 @@ def _cmd_analyze(args: argparse.Namespace) -> None:
 
     # Timeline
     timeline = build_timeline(events, resources)
-    timeline_path = Path(cfg.analyzer.summary_output) / "timeline.json"
-    save_timeline(timeline, timeline_path)
+    if len(timeline) > _NDJSON_TIMELINE_MIN_ENTRIES:
+        timeline_path = Path(cfg.analyzer.summary_output) / "timeline.jsonl"
+        save_timeline_ndjson(timeline, timeline_path)
+    else:
+        timeline_path = Path(cfg.analyzer.summary_output) / "timeline.json"
+        save_timeline(timeline, timeline_path)
     print(f"Timeline saved to {timeline_path} ({len(timeline)} entries)")
 
     if not args.no_table:
@@ -104,6 +118,9 @@ def _cmd_analyze(args: argparse.Namespace) -> None:
 
 def _cmd_generate_config(args: argparse.Namespace) -> None:
     """Generate OpenClaw diagnostics configuration."""
+    from . import _json
+    from .config import load_config
+
     cfg = load_config(args.config)
 
     openclaw_config = {
@@ -136,8 +153,7 @@ def _cmd_generate_config(args: argparse.Namespace) -> None:
 
     output = args.output or "openclaw.diagnostics.json"
     Path(output).parent.mkdir(parents=True, exist_ok=True)
-    with open(output, "w", encoding="utf-8") as fh:
-        json.dump(openclaw_config, fh, indent=2)
+    Path(output).write_bytes(_json.dumps(openclaw_config, indent=True))
     print(f"OpenClaw diagnostics config written to {output}")
     print()
     print("To apply, merge into your ~/.openclaw/openclaw.json or run:")
@@ -152,8 +168,12 @@ def _cmd_version(_args: argparse.Namespace) -> None:
     print(f"trace_claw {__version__}")
 
 
-def main(argv: list[str] | None = None) -> None:
-    """Entry point for the trace-claw CLI."""
+def main(argv: list[str] | None = None) -> int:
+    """Entry point for the trace-claw CLI.
+
+    Returns the process exit status, so the CLI can also be driven
+    in-process (e.g. from tests) with an explicit *argv*.
+    """
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
@@ -188,10 +208,11 @@ def main(argv: list[str] | None = None) -> None:
     args = parser.parse_args(argv)
     if not hasattr(args, "func"):
         parser.print_help()
-        sys.exit(1)
+        return 1
 
     args.func(args)
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
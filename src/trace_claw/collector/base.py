@@ -6,8 +6,10 @@ import abc
 from dataclasses import dataclass
 from typing import Any
 
+from .. import _json
 
-@dataclass
+
+@dataclass(slots=True)
 class MetricSample:
     """A single metric data point."""
 
@@ -16,6 +18,8 @@ class MetricSample:
     unit: str
     timestamp: float
     labels: dict[str, str]
+    # Built-in collectors leave this empty; exporters fall back to
+    # collector.descriptions.METRIC_DESCRIPTIONS keyed by ``name``.
     description: str = ""
 
 
@@ -28,8 +32,26 @@ class BaseCollector(abc.ABC):
         """Collector name used in configuration and output."""
 
     @abc.abstractmethod
-    def collect(self) -> list[MetricSample]:
-        """Collect current resource metrics. Returns a list of samples."""
+    def collect(self, now: float | None = None) -> list[MetricSample]:
+        """Collect current resource metrics. Returns a list of samples.
+
+        *now* is the timestamp stamped on every sample; when omitted the
+        collector reads the clock itself.
+        """
+
+    def collect_into(self, out: list[MetricSample], now: float | None = None) -> None:
+        """Append current samples to *out* instead of returning a new list.
+
+        The default delegates to :meth:`collect` without *now*, so
+        subclasses written against the older ``collect(self)`` signature
+        keep working (their samples carry their own timestamps).  The
+        built-in collectors override it to append directly, stamped with
+        *now*, and skip the intermediate list.
+        """
+        out.extend(self.collect())
+
+    def close(self) -> None:
+        """Release any resources held by the collector (threads, files)."""
 
     def to_dict(self, samples: list[MetricSample]) -> list[dict[str, Any]]:
         """Serialize samples to plain dictionaries."""
@@ -44,3 +66,11 @@ class BaseCollector(abc.ABC):
             }
             for s in samples
         ]
+
+    def to_json_bytes(self, samples: list[MetricSample]) -> bytes:
+        """Serialize samples straight to a JSON array.
+
+        Equivalent to encoding :meth:`to_dict`, but the dataclasses are
+        handed to the encoder directly, skipping the intermediate dicts.
+        """
+        return _json.dumps(samples)
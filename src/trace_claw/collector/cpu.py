@@ -12,51 +12,65 @@ from .base import BaseCollector, MetricSample
 class CpuCollector(BaseCollector):
     """Collects CPU usage metrics."""
 
+    def __init__(self) -> None:
+        # Per-core labels never change between ticks, so they are built
+        # once instead of once per core per collection.
+        self._core_labels: list[dict[str, str]] = []
+        self._ensure_cores(psutil.cpu_count() or 1)
+
+    def _ensure_cores(self, count: int) -> None:
+        for idx in range(len(self._core_labels), count):
+            self._core_labels.append({"cpu": str(idx)})
+
     @property
     def name(self) -> str:
         return "cpu"
 
-    def collect(self) -> list[MetricSample]:
-        now = time.time()
+    def collect(self, now: float | None = None) -> list[MetricSample]:
         samples: list[MetricSample] = []
+        self.collect_into(samples, now)
+        return samples
+
+    def collect_into(self, out: list[MetricSample], now: float | None = None) -> None:
+        if now is None:
+            now = time.time()
+        append = out.append
 
-        overall = psutil.cpu_percent(interval=0)
-        samples.append(MetricSample(
+        # One /proc/stat read per tick: the overall figure is the mean of
+        # the per-core percentages over the same window.
+        per_cpu = psutil.cpu_percent(interval=0, percpu=True)
+        overall = sum(per_cpu) / len(per_cpu) if per_cpu else 0.0
+        append(MetricSample(
             name="system.cpu.usage_percent",
             value=overall,
             unit="%",
             timestamp=now,
             labels={"cpu": "total"},
-            description="Overall CPU usage percentage",
         ))
 
-        per_cpu = psutil.cpu_percent(interval=0, percpu=True)
-        for idx, pct in enumerate(per_cpu):
-            samples.append(MetricSample(
+        if len(per_cpu) > len(self._core_labels):  # CPU hotplug
+            self._ensure_cores(len(per_cpu))
+        for pct, labels in zip(per_cpu, self._core_labels):
+            append(MetricSample(
                 name="system.cpu.usage_percent",
                 value=pct,
                 unit="%",
                 timestamp=now,
-                labels={"cpu": str(idx)},
-                description=f"CPU core {idx} usage percentage",
+                labels=labels,
             ))
 
         load1, load5, load15 = psutil.getloadavg()
-        samples.append(MetricSample(
+        append(MetricSample(
             name="system.cpu.load_avg_1m",
             value=load1,
             unit="1",
             timestamp=now,
             labels={},
-            description="Load average 1 minute",
         ))
-        samples.append(MetricSample(
+        append(MetricSample(
             name="system.cpu.load_avg_5m",
             value=load5,
             unit="1",
             timestamp=now,
             labels={},
-            description="Load average 5 minutes",
         ))
-
-        return samples
@@ -0,0 +1,32 @@
+"""Static descriptions for the metrics emitted by the built-in collectors.
+
+Descriptions are only needed once per metric name (when an exporter
+registers an instrument), so they live here rather than on every sample.
+"""
+
+from __future__ import annotations
+
+METRIC_DESCRIPTIONS: dict[str, str] = {
+    # cpu
+    "system.cpu.usage_percent": "CPU usage percentage (cpu=total or per core)",
+    "system.cpu.load_avg_1m": "Load average 1 minute",
+    "system.cpu.load_avg_5m": "Load average 5 minutes",
+    # memory
+    "system.memory.usage_percent": "Memory usage percentage",
+    "system.memory.used_bytes": "Memory used in bytes",
+    "system.memory.available_bytes": "Memory available in bytes",
+    "system.memory.total_bytes": "Total memory in bytes",
+    "system.swap.usage_percent": "Swap usage percentage",
+    # network
+    "system.network.bytes_sent_total": "Total bytes sent per interface",
+    "system.network.bytes_recv_total": "Total bytes received per interface",
+    "system.network.bytes_sent_rate": "Send rate per interface",
+    "system.network.bytes_recv_rate": "Receive rate per interface",
+    # process
+    "process.cpu.usage_percent": "CPU usage of the target process",
+    "process.memory.rss_bytes": "Resident set size of the target process",
+    "process.memory.vms_bytes": "Virtual memory size of the target process",
+    "process.memory.usage_percent": "Memory % of the target process",
+    "process.io.read_bytes": "IO read bytes of the target process",
+    "process.io.write_bytes": "IO write bytes of the target process",
+}
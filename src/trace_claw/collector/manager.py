@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import queue
 import threading
 import time
 from typing import Callable
@@ -16,6 +17,13 @@ from .process import ProcessCollector
 
 logger = logging.getLogger(__name__)
 
+# Collected batches waiting for each sink thread; beyond this the oldest
+# batch is dropped so a stalled exporter cannot grow memory without bound.
+_SINK_QUEUE_MAX_BATCHES = 64
+
+# How long stop() waits for each sink thread to deliver its queued batches.
+_SINK_JOIN_TIMEOUT_S = 5.0
+
 
 class CollectorManager:
     """Manages multiple resource collectors and runs them on an interval.
@@ -30,6 +38,9 @@ class CollectorManager:
         self._collectors: list[BaseCollector] = []
         self._sinks: list[Callable[[list[MetricSample]], None]] = []
         self._thread: threading.Thread | None = None
+        # one queue and worker thread per sink while running in the background
+        self._sink_queues: list[queue.Queue[list[MetricSample] | None]] = []
+        self._sink_threads: list[tuple[Callable[[list[MetricSample]], None], threading.Thread]] = []
         self._stop_event = threading.Event()
 
         if config.cpu:
@@ -39,32 +50,76 @@ class CollectorManager:
         if config.network:
             self._collectors.append(NetworkCollector(interface=config.network_interface))
         if config.process_filter_enabled and config.process_name:
-            self._collectors.append(ProcessCollector(process_name=config.process_name))
+            self._collectors.append(ProcessCollector(
+                process_name=config.process_name,
+                rescan_interval=config.process_rescan_interval,
+                cpu_min_interval=config.process_cpu_min_interval,
+            ))
 
     def add_sink(self, sink: Callable[[list[MetricSample]], None]) -> None:
-        """Register a callback to receive collected samples."""
+        """Register a callback to receive collected samples.
+
+        While running in the background, each sink is called from its own
+        thread, so a slow exporter delays neither collection nor the other
+        sinks.  Every sink receives the same batch list and must not modify
+        it.
+        """
         self._sinks.append(sink)
+        if self._thread is not None:
+            self._start_sink_worker(sink)
 
     def collect_once(self) -> list[MetricSample]:
-        """Run all collectors once and return aggregated samples."""
+        """Run all collectors once and return aggregated samples.
+
+        The clock is read once per tick so every sample carries the same
+        timestamp.
+        """
         all_samples: list[MetricSample] = []
+        self._collect_into(all_samples)
+        return all_samples
+
+    def _collect_into(self, out: list[MetricSample]) -> None:
+        now = time.time()
         for collector in self._collectors:
             try:
-                all_samples.extend(collector.collect())
+                collector.collect_into(out, now)
             except Exception:
                 logger.exception("Collector %s failed", collector.name)
-        return all_samples
 
     def _run(self) -> None:
-        """Background thread loop."""
+        """Background collection loop; hands each tick to the sink threads."""
+        interval = self._config.interval_seconds
+        # Ticks are scheduled against a monotonic deadline so the period
+        # stays at *interval* rather than interval + collection time.
+        next_tick = time.monotonic()
+        overrunning = False
         while not self._stop_event.is_set():
-            samples = self.collect_once()
-            for sink in self._sinks:
-                try:
-                    sink(samples)
-                except Exception:
-                    logger.exception("Sink failed")
-            self._stop_event.wait(self._config.interval_seconds)
+            samples: list[MetricSample] = []
+            self._collect_into(samples)
+            self._enqueue(samples)
+            next_tick += interval
+            sleep_for = next_tick - time.monotonic()
+            if sleep_for <= 0:
+                if not overrunning:
+                    logger.warning("Collection overran the %.2fs interval; skipping missed ticks", interval)
+                    overrunning = True
+                # resynchronize instead of firing a burst of catch-up ticks
+                next_tick = time.monotonic()
+                sleep_for = 0.0
+            else:
+                overrunning = False
+            self._stop_event.wait(sleep_for)
+
+    def _enqueue(self, samples: list[MetricSample] | None) -> None:
+        for sink_queue in self._sink_queues:
+            _put_dropping_oldest(sink_queue, samples)
+
+    def _start_sink_worker(self, sink: Callable[[list[MetricSample]], None]) -> None:
+        sink_queue: queue.Queue[list[MetricSample] | None] = queue.Queue(maxsize=_SINK_QUEUE_MAX_BATCHES)
+        thread = threading.Thread(target=_drain, args=(sink_queue, sink), daemon=True)
+        self._sink_queues.append(sink_queue)
+        self._sink_threads.append((sink, thread))
+        thread.start()
 
     def start(self) -> None:
         """Start collecting in the background."""
@@ -73,14 +128,60 @@ class CollectorManager:
         if self._thread is not None:
             return
         self._stop_event.clear()
+        for sink in self._sinks:
+            self._start_sink_worker(sink)
         self._thread = threading.Thread(target=self._run, daemon=True)
         self._thread.start()
         logger.info("CollectorManager started (interval=%.1fs)", self._config.interval_seconds)
 
-    def stop(self) -> None:
-        """Stop background collection."""
+    def stop(self) -> list[Callable[[list[MetricSample]], None]]:
+        """Stop background collection.
+
+        Returns the sinks whose thread was still running when the join
+        timed out.  Such a sink may still be called with a queued batch,
+        so the exporter behind it must not be shut down yet.
+        """
         self._stop_event.set()
         if self._thread is not None:
             self._thread.join(timeout=5)
             self._thread = None
+        # batches already queued are delivered before the sentinel
+        self._enqueue(None)
+        unfinished = []
+        for sink, thread in self._sink_threads:
+            thread.join(timeout=_SINK_JOIN_TIMEOUT_S)
+            if thread.is_alive():
+                unfinished.append(sink)
+        if unfinished:
+            logger.warning("%d sink(s) still draining after %.0fs", len(unfinished), _SINK_JOIN_TIMEOUT_S)
+        self._sink_queues.clear()
+        self._sink_threads.clear()
+        for collector in self._collectors:
+            collector.close()
         logger.info("CollectorManager stopped")
+        return unfinished
+
+
+def _put_dropping_oldest(sink_queue: queue.Queue[list[MetricSample] | None], item: list[MetricSample] | None) -> None:
+    while True:
+        try:
+            sink_queue.put_nowait(item)
+            return
+        except queue.Full:
+            try:
+                sink_queue.get_nowait()
+                logger.warning("A sink is falling behind; dropped its oldest sample batch")
+            except queue.Empty:
+                pass
+
+
+def _drain(sink_queue: queue.Queue[list[MetricSample] | None], sink: Callable[[list[MetricSample]], None]) -> None:
+    """Sink thread loop; runs until the ``None`` sentinel is received."""
+    while True:
+        samples = sink_queue.get()
+        if samples is None:
+            return
+        try:
+            sink(samples)
+        except Exception:
+            logger.exception("Sink failed")
@@ -16,19 +16,24 @@ class MemoryCollector(BaseCollector):
     def name(self) -> str:
         return "memory"
 
-    def collect(self) -> list[MetricSample]:
-        now = time.time()
+    def collect(self, now: float | None = None) -> list[MetricSample]:
+        samples: list[MetricSample] = []
+        self.collect_into(samples, now)
+        return samples
+
+    def collect_into(self, out: list[MetricSample], now: float | None = None) -> None:
+        if now is None:
+            now = time.time()
         mem = psutil.virtual_memory()
         swap = psutil.swap_memory()
 
-        return [
+        out.extend((
             MetricSample(
                 name="system.memory.usage_percent",
                 value=mem.percent,
                 unit="%",
                 timestamp=now,
                 labels={},
-                description="Memory usage percentage",
             ),
             MetricSample(
                 name="system.memory.used_bytes",
@@ -36,7 +41,6 @@ class MemoryCollector(BaseCollector):
                 unit="bytes",
                 timestamp=now,
                 labels={},
-                description="Memory used in bytes",
             ),
             MetricSample(
                 name="system.memory.available_bytes",
@@ -44,7 +48,6 @@ class MemoryCollector(BaseCollector):
                 unit="bytes",
                 timestamp=now,
                 labels={},
-                description="Memory available in bytes",
             ),
             MetricSample(
                 name="system.memory.total_bytes",
@@ -52,7 +55,6 @@ class MemoryCollector(BaseCollector):
                 unit="bytes",
                 timestamp=now,
                 labels={},
-                description="Total memory in bytes",
             ),
             MetricSample(
                 name="system.swap.usage_percent",
@@ -60,6 +62,5 @@ class MemoryCollector(BaseCollector):
                 unit="%",
                 timestamp=now,
                 labels={},
-                description="Swap usage percentage",
             ),
-        ]
+        ))
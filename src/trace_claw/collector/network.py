@@ -2,12 +2,57 @@
 
 from __future__ import annotations
 
+import os
 import time
 
 import psutil
 
 from .base import BaseCollector, MetricSample
 
+_PROC_NET_DEV = "/proc/net/dev"
+
+
+def _pread_all(fd: int, bufsize: int = 16 * 1024) -> bytes:
+    """Read the whole file behind *fd* from offset 0 with pread().
+
+    procfs seq_files return at most about a page per read regardless of
+    the buffer size, so a short read does not mean end of file; keep
+    reading at the next offset until a read returns nothing.
+    """
+    chunks: list[bytes] = []
+    offset = 0
+    while True:
+        chunk = os.pread(fd, bufsize, offset)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+        offset += len(chunk)
+
+
+def _parse_net_dev(data: bytes, interface: str = "") -> list[tuple[str, int, int]]:
+    """Return ``(iface, bytes_sent, bytes_recv)`` readings from /proc/net/dev *data*.
+
+    With *interface* only that line is split, so a single configured
+    interface costs no per-NIC allocations; if it is not listed, every
+    interface is returned, as when none is configured.
+    """
+    lines = data.splitlines()[2:]
+    if interface:
+        key = interface.encode()
+        for line in lines:
+            name, sep, rest = line.partition(b":")
+            if sep and name.strip() == key:
+                fields = rest.split()
+                # receive bytes is column 0, transmit bytes column 8
+                return [(interface, int(fields[8]), int(fields[0]))]
+    readings: list[tuple[str, int, int]] = []
+    for line in lines:
+        name, sep, rest = line.partition(b":")
+        if sep:
+            fields = rest.split()
+            readings.append((os.fsdecode(name.strip()), int(fields[8]), int(fields[0])))
+    return readings
+
 
 class NetworkCollector(BaseCollector):
     """Collects network I/O metrics."""
@@ -16,67 +61,98 @@ class NetworkCollector(BaseCollector):
         self._interface = interface
         self._prev_counters: dict[str, tuple[int, int]] | None = None
         self._prev_time: float | None = None
+        # iface -> label dict, built on first sight and reused every tick
+        self._iface_labels: dict[str, dict[str, str]] = {}
+        # /proc/net/dev is opened once and re-read with pread() each tick
+        self._net_dev_fd: int | None = None
 
     @property
     def name(self) -> str:
         return "network"
 
-    def collect(self) -> list[MetricSample]:
-        now = time.time()
+    def close(self) -> None:
+        if self._net_dev_fd is not None:
+            os.close(self._net_dev_fd)
+            self._net_dev_fd = None
+
+    def _read_net_dev(self) -> bytes | None:
+        """Return the current /proc/net/dev contents, or ``None`` if unavailable."""
+        try:
+            if self._net_dev_fd is None:
+                self._net_dev_fd = os.open(_PROC_NET_DEV, os.O_RDONLY)
+            return _pread_all(self._net_dev_fd)
+        except OSError:
+            self.close()
+            return None
+
+    def collect(self, now: float | None = None) -> list[MetricSample]:
         samples: list[MetricSample] = []
+        self.collect_into(samples, now)
+        return samples
 
-        counters = psutil.net_io_counters(pernic=True)
-        interfaces = [self._interface] if self._interface and self._interface in counters else list(counters.keys())
+    def collect_into(self, out: list[MetricSample], now: float | None = None) -> None:
+        if now is None:
+            now = time.time()
+        # wall-clock *now* is only the sample timestamp; rates are computed
+        # from the monotonic clock so NTP steps cannot skew or negate them
+        mono = time.monotonic()
+        append = out.append
+
+        data = self._read_net_dev()
+        if data is not None:
+            readings = _parse_net_dev(data, self._interface)
+        else:
+            counters = psutil.net_io_counters(pernic=True)
+            if self._interface and self._interface in counters:
+                nio = counters[self._interface]
+                readings = [(self._interface, nio.bytes_sent, nio.bytes_recv)]
+            else:
+                readings = [(iface, nio.bytes_sent, nio.bytes_recv) for iface, nio in counters.items()]
 
         current: dict[str, tuple[int, int]] = {}
-        for iface in interfaces:
+        for iface, sent, recv in readings:
             if iface == "lo":
                 continue
-            nio = counters.get(iface)
-            if nio is None:
-                continue
-            current[iface] = (nio.bytes_sent, nio.bytes_recv)
+            current[iface] = (sent, recv)
+            labels = self._iface_labels.get(iface)
+            if labels is None:
+                labels = self._iface_labels[iface] = {"interface": iface}
 
-            samples.append(MetricSample(
+            append(MetricSample(
                 name="system.network.bytes_sent_total",
-                value=float(nio.bytes_sent),
+                value=float(sent),
                 unit="bytes",
                 timestamp=now,
-                labels={"interface": iface},
-                description=f"Total bytes sent on {iface}",
+                labels=labels,
             ))
-            samples.append(MetricSample(
+            append(MetricSample(
                 name="system.network.bytes_recv_total",
-                value=float(nio.bytes_recv),
+                value=float(recv),
                 unit="bytes",
                 timestamp=now,
-                labels={"interface": iface},
-                description=f"Total bytes received on {iface}",
+                labels=labels,
             ))
 
-            if self._prev_counters and self._prev_time:
-                dt = now - self._prev_time
+            if self._prev_counters and self._prev_time is not None:
+                dt = mono - self._prev_time
                 if dt > 0 and iface in self._prev_counters:
                     prev_sent, prev_recv = self._prev_counters[iface]
-                    rate_sent = (nio.bytes_sent - prev_sent) / dt
-                    rate_recv = (nio.bytes_recv - prev_recv) / dt
-                    samples.append(MetricSample(
+                    rate_sent = (sent - prev_sent) / dt
+                    rate_recv = (recv - prev_recv) / dt
+                    append(MetricSample(
                         name="system.network.bytes_sent_rate",
                         value=rate_sent,
                         unit="bytes/s",
                         timestamp=now,
-                        labels={"interface": iface},
-                        description=f"Send rate on {iface}",
+                        labels=labels,
                     ))
-                    samples.append(MetricSample(
+                    append(MetricSample(
                         name="system.network.bytes_recv_rate",
                         value=rate_recv,
                         unit="bytes/s",
                         timestamp=now,
-                        labels={"interface": iface},
-                        description=f"Receive rate on {iface}",
+                        labels=labels,
                     ))
 
         self._prev_counters = current
-        self._prev_time = now
-        return samples
+        self._prev_time = mono
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import logging
+import os
 import time
+from typing import Callable
 
 import psutil
 
@@ -11,39 +13,113 @@ from .base import BaseCollector, MetricSample
 
 logger = logging.getLogger(__name__)
 
+_HAVE_PROC = psutil.LINUX and os.path.isdir("/proc/self")
+
 
 def find_pids_by_name(process_name: str) -> list[int]:
     """Return a list of PIDs whose process name or cmdline contains *process_name*.
 
     The match is case-insensitive and checks both ``psutil.Process.name()``
-    and the first element of ``cmdline()``.
+    and the first element of ``cmdline()``.  On Linux /proc is read
+    directly; elsewhere psutil is used.
     """
-    pids: list[int] = []
     target = process_name.lower()
+    if _HAVE_PROC:
+        return _scan_proc(target)
+    return _scan_psutil(target)
+
+
+def _scan_proc(target: str) -> list[int]:
+    """Linux fast path: read ``comm`` and ``cmdline`` straight from /proc.
+
+    This skips psutil's per-process object creation and its cmdline read
+    for processes whose name already matches.  ``comm`` is the name
+    psutil reports (truncated to 15 bytes); the untruncated name is still
+    covered by the ``cmdline[0]`` check.
+    """
+    pids: list[int] = []
+    with os.scandir("/proc") as it:
+        for entry in it:
+            pid = entry.name
+            if not pid.isdigit():
+                continue
+            try:
+                with open(f"/proc/{pid}/comm", "rb") as fh:
+                    comm = fh.read()
+                if target in comm.decode("utf-8", "replace").lower():
+                    pids.append(int(pid))
+                    continue
+                with open(f"/proc/{pid}/cmdline", "rb") as fh:
+                    cmdline = fh.read()
+            except OSError:
+                # exited mid-scan, or hidden from us
+                continue
+            arg0 = _cmdline_arg0(cmdline)
+            if arg0 and target in arg0.decode("utf-8", "replace").lower():
+                pids.append(int(pid))
+    return pids
+
+
+def _cmdline_arg0(raw: bytes) -> bytes:
+    """Return the first argument of a raw /proc/<pid>/cmdline, split as psutil does.
+
+    Arguments are normally NUL-separated, but processes that rewrite their
+    title (setproctitle and the like) may separate them with spaces.
+    """
+    sep = b"\0" if raw.endswith(b"\0") else b" "
+    if raw.endswith(sep):
+        raw = raw[:-1]
+    args = raw.split(sep)
+    if sep == b"\0" and len(args) == 1 and b" " in raw:
+        args = raw.split(b" ")
+    return args[0]
+
+
+def _scan_psutil(target: str) -> list[int]:
+    pids: list[int] = []
+    # process_iter() pre-fetches the attributes into ``info`` and already
+    # maps access errors to None, so the loop itself cannot raise.  The
+    # cmdline is only inspected when the name does not match.
     for proc in psutil.process_iter(["pid", "name", "cmdline"]):
-        try:
-            pname = (proc.info.get("name") or "").lower()
-            cmdline = proc.info.get("cmdline") or []
-            cmd0 = cmdline[0].lower() if cmdline else ""
-            if target in pname or target in cmd0:
-                pids.append(proc.info["pid"])
-        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+        info = proc.info
+        name = info["name"]
+        if name and target in name.lower():
+            pids.append(info["pid"])
             continue
+        cmdline = info["cmdline"]
+        if cmdline and target in cmdline[0].lower():
+            pids.append(info["pid"])
     return pids
 
 
 class ProcessCollector(BaseCollector):
     """Collects per-process CPU, memory and I/O metrics.
 
-    The collector resolves *process_name* to PIDs on each call so it
-    handles process restarts gracefully.  Metrics are tagged with
+    Scanning every process to resolve *process_name* is expensive, so the
+    matching PIDs are cached and the scan is repeated only after
+    *rescan_interval* seconds, or as soon as a cached process is no longer
+    running (``is_running`` also catches PID reuse).  Process restarts are
+    therefore still picked up on the next call.  Metrics are tagged with
     ``pid`` and ``process_name`` labels.
     """
 
-    def __init__(self, process_name: str) -> None:
+    def __init__(
+        self,
+        process_name: str,
+        rescan_interval: float = 30.0,
+        cpu_min_interval: float = 0.5,
+    ) -> None:
         self._process_name = process_name
+        self._rescan_interval = rescan_interval
+        self._cpu_min_interval = cpu_min_interval
         # Cache psutil.Process objects keyed by pid so cpu_percent works
         self._proc_cache: dict[int, psutil.Process] = {}
+        self._pids: list[int] = []
+        self._last_scan: float | None = None
+        # pid -> label dict; see _labels
+        self._pid_labels: dict[int, dict[str, str]] = {}
+        # pid -> (monotonic time, value) of the last real cpu_percent reading
+        self._last_cpu: dict[int, tuple[float, float]] = {}
 
     @property
     def name(self) -> str:
@@ -62,97 +138,148 @@ class ProcessCollector(BaseCollector):
                 return None
         return proc
 
-    def collect(self) -> list[MetricSample]:
-        now = time.time()
+    def _labels(self, pid: int) -> dict[str, str]:
+        """Return the label dict for *pid*, built once per PID."""
+        labels = self._pid_labels.get(pid)
+        if labels is None:
+            labels = self._pid_labels[pid] = {"pid": str(pid), "process_name": self._process_name}
+        return labels
+
+    def _resolve_pids(self) -> list[int]:
+        """Return the matching PIDs, rescanning only when the cache is stale."""
+        mono = time.monotonic()
+        if (
+            self._pids
+            and self._last_scan is not None
+            and mono - self._last_scan < self._rescan_interval
+        ):
+            cache = self._proc_cache
+            for pid in self._pids:
+                proc = cache.get(pid)
+                if proc is None:
+                    break
+                if not proc.is_running():
+                    # exited, or the PID now belongs to another process:
+                    # drop the stale object so a reused PID is re-primed
+                    del cache[pid]
+                    self._last_cpu.pop(pid, None)
+                    break
+            else:
+                return self._pids
+        self._pids = find_pids_by_name(self._process_name)
+        self._last_scan = mono
+        return self._pids
+
+    def collect(self, now: float | None = None) -> list[MetricSample]:
         samples: list[MetricSample] = []
+        self.collect_into(samples, now)
+        return samples
+
+    def collect_into(self, out: list[MetricSample], now: float | None = None) -> None:
+        if now is None:
+            now = time.time()
+        append = out.append
 
-        pids = find_pids_by_name(self._process_name)
+        pids = self._resolve_pids()
         if not pids:
             logger.debug("No process found matching %r", self._process_name)
-            return samples
+            return
 
         # Evict stale entries from cache
         live_set = set(pids)
         for stale_pid in list(self._proc_cache):
             if stale_pid not in live_set:
                 self._proc_cache.pop(stale_pid, None)
+        for stale_pid in list(self._pid_labels):
+            if stale_pid not in live_set:
+                del self._pid_labels[stale_pid]
+        for stale_pid in list(self._last_cpu):
+            if stale_pid not in live_set:
+                del self._last_cpu[stale_pid]
 
         for pid in pids:
-            proc = self._get_proc(pid)
-            if proc is None:
-                continue
+            self._collect_pid(pid, now, append)
+
+    def _collect_pid(self, pid: int, now: float, append: Callable[[MetricSample], None]) -> None:
+        """Append the samples for a single PID."""
+        proc = self._get_proc(pid)
+        if proc is None:
+            return
 
-            labels = {"pid": str(pid), "process_name": self._process_name}
+        labels = self._labels(pid)
 
+        # oneshot() lets psutil read /proc/<pid>/stat and friends once
+        # for all of the calls below instead of once per call.
+        with proc.oneshot():
             try:
-                cpu = proc.cpu_percent(interval=0)
-                samples.append(MetricSample(
+                # cpu_percent over a very short window is mostly noise;
+                # below the minimum interval reuse the last reading.
+                mono = time.monotonic()
+                last = self._last_cpu.get(pid)
+                if last is not None and mono - last[0] < self._cpu_min_interval:
+                    cpu = last[1]
+                else:
+                    cpu = proc.cpu_percent(interval=0)
+                    self._last_cpu[pid] = (mono, cpu)
+                append(MetricSample(
                     name="process.cpu.usage_percent",
                     value=cpu,
                     unit="%",
                     timestamp=now,
                     labels=labels,
-                    description=f"CPU usage for {self._process_name} (pid {pid})",
                 ))
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 self._proc_cache.pop(pid, None)
-                continue
+                return
 
             try:
                 mem = proc.memory_info()
-                samples.append(MetricSample(
+                append(MetricSample(
                     name="process.memory.rss_bytes",
                     value=float(mem.rss),
                     unit="bytes",
                     timestamp=now,
                     labels=labels,
-                    description=f"RSS for {self._process_name} (pid {pid})",
                 ))
-                samples.append(MetricSample(
+                append(MetricSample(
                     name="process.memory.vms_bytes",
                     value=float(mem.vms),
                     unit="bytes",
                     timestamp=now,
                     labels=labels,
-                    description=f"VMS for {self._process_name} (pid {pid})",
                 ))
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 self._proc_cache.pop(pid, None)
-                continue
+                return
 
             try:
                 mem_pct = proc.memory_percent()
-                samples.append(MetricSample(
+                append(MetricSample(
                     name="process.memory.usage_percent",
                     value=mem_pct,
                     unit="%",
                     timestamp=now,
                     labels=labels,
-                    description=f"Memory % for {self._process_name} (pid {pid})",
                 ))
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 pass
 
             try:
                 io = proc.io_counters()
-                samples.append(MetricSample(
+                append(MetricSample(
                     name="process.io.read_bytes",
                     value=float(io.read_bytes),
                     unit="bytes",
                     timestamp=now,
                     labels=labels,
-                    description=f"IO read bytes for {self._process_name} (pid {pid})",
                 ))
-                samples.append(MetricSample(
+                append(MetricSample(
                     name="process.io.write_bytes",
                     value=float(io.write_bytes),
                     unit="bytes",
                     timestamp=now,
                     labels=labels,
-                    description=f"IO write bytes for {self._process_name} (pid {pid})",
                 ))
             except (psutil.NoSuchProcess, psutil.AccessDenied, AttributeError):
                 # io_counters() may not be available on all platforms
                 pass
-
-        return samples
@@ -7,8 +7,6 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 
 @dataclass
 class OtelExporterConfig:
@@ -32,6 +30,8 @@ class CollectorConfig:
     network_interface: str = ""
     process_name: str = "node"
     process_filter_enabled: bool = False
+    process_rescan_interval: float = 30.0
+    process_cpu_min_interval: float = 0.5
 
 
 @dataclass
@@ -77,6 +77,19 @@ class TraceClawConfig:
     analyzer: AnalyzerConfig = field(default_factory=AnalyzerConfig)
 
 
+# Accepted keys per config section, resolved once at import.
+_OTEL_FIELDS = frozenset(OtelExporterConfig.__dataclass_fields__)
+_COLLECTOR_FIELDS = frozenset(CollectorConfig.__dataclass_fields__)
+_LOCAL_EXPORTER_FIELDS = frozenset(LocalExporterConfig.__dataclass_fields__)
+_OPENCLAW_FIELDS = frozenset(OpenClawConfig.__dataclass_fields__)
+_ANALYZER_FIELDS = frozenset(AnalyzerConfig.__dataclass_fields__)
+
+
+def _known(fields: frozenset[str], section: dict[str, Any]) -> dict[str, Any]:
+    """Return the items of *section* whose keys are dataclass fields."""
+    return {k: section[k] for k in fields & section.keys()}
+
+
 def _merge_dict(target: dict[str, Any], source: dict[str, Any]) -> dict[str, Any]:
     """Recursively merge *source* into *target*."""
     for key, value in source.items():
@@ -87,28 +100,28 @@ def _merge_dict(target: dict[str, Any], source: dict[str, Any]) -> dict[str, Any
     return target
 
 
+# Environment variable -> (config path, value type).  Built once at import
+# time; os.environ itself is read on every call so late changes still apply.
+_ENV_OVERRIDES: dict[str, tuple[tuple[str, ...], type]] = {
+    "TRACE_CLAW_MODE": (("mode",), str),
+    "TRACE_CLAW_OTEL_ENDPOINT": (("otel", "endpoint"), str),
+    "TRACE_CLAW_OTEL_SERVICE_NAME": (("otel", "service_name"), str),
+    "TRACE_CLAW_COLLECTOR_INTERVAL": (("collector", "interval_seconds"), float),
+    "TRACE_CLAW_COLLECTOR_PROCESS": (("collector", "process_name"), str),
+    "TRACE_CLAW_LOCAL_OUTPUT_DIR": (("local_exporter", "output_dir"), str),
+}
+
+
 def _apply_env_overrides(data: dict[str, Any]) -> dict[str, Any]:
     """Apply environment variable overrides using TRACE_CLAW_ prefix."""
-    env_map = {
-        "TRACE_CLAW_MODE": ("mode",),
-        "TRACE_CLAW_OTEL_ENDPOINT": ("otel", "endpoint"),
-        "TRACE_CLAW_OTEL_SERVICE_NAME": ("otel", "service_name"),
-        "TRACE_CLAW_COLLECTOR_INTERVAL": ("collector", "interval_seconds"),
-        "TRACE_CLAW_COLLECTOR_PROCESS": ("collector", "process_name"),
-        "TRACE_CLAW_LOCAL_OUTPUT_DIR": ("local_exporter", "output_dir"),
-    }
-    for env_key, path in env_map.items():
-        value = os.environ.get(env_key)
+    environ = os.environ
+    for env_key, (path, convert) in _ENV_OVERRIDES.items():
+        value = environ.get(env_key)
         if value is not None:
             obj = data
             for part in path[:-1]:
                 obj = obj.setdefault(part, {})
-            final_key = path[-1]
-            # coerce numeric values
-            if final_key == "interval_seconds":
-                obj[final_key] = float(value)
-            else:
-                obj[final_key] = value
+            obj[path[-1]] = convert(value)
     return data
 
 
@@ -122,26 +135,11 @@ def _dict_to_config(data: dict[str, Any]) -> TraceClawConfig:
 
     return TraceClawConfig(
         mode=data.get("mode", "local"),
-        otel=OtelExporterConfig(**{
-            k: v for k, v in otel_data.items()
-            if k in OtelExporterConfig.__dataclass_fields__
-        }),
-        collector=CollectorConfig(**{
-            k: v for k, v in collector_data.items()
-            if k in CollectorConfig.__dataclass_fields__
-        }),
-        local_exporter=LocalExporterConfig(**{
-            k: v for k, v in local_data.items()
-            if k in LocalExporterConfig.__dataclass_fields__
-        }),
-        openclaw=OpenClawConfig(**{
-            k: v for k, v in openclaw_data.items()
-            if k in OpenClawConfig.__dataclass_fields__
-        }),
-        analyzer=AnalyzerConfig(**{
-            k: v for k, v in analyzer_data.items()
-            if k in AnalyzerConfig.__dataclass_fields__
-        }),
+        otel=OtelExporterConfig(**_known(_OTEL_FIELDS, otel_data)),
+        collector=CollectorConfig(**_known(_COLLECTOR_FIELDS, collector_data)),
+        local_exporter=LocalExporterConfig(**_known(_LOCAL_EXPORTER_FIELDS, local_data)),
+        openclaw=OpenClawConfig(**_known(_OPENCLAW_FIELDS, openclaw_data)),
+        analyzer=AnalyzerConfig(**_known(_ANALYZER_FIELDS, analyzer_data)),
     )
 
 
@@ -157,8 +155,17 @@ def load_config(path: str | Path | None = None) -> TraceClawConfig:
         path = Path(path)
 
     if path.exists():
+        # PyYAML is only imported when there is a file to parse, which
+        # keeps it off the import path of config-less CLI runs.
+        import yaml
+
+        try:
+            from yaml import CSafeLoader as SafeLoader
+        except ImportError:  # pragma: no cover - PyYAML built without libyaml
+            from yaml import SafeLoader  # type: ignore[assignment]
+
         with open(path, encoding="utf-8") as fh:
-            loaded = yaml.safe_load(fh)
+            loaded = yaml.load(fh, Loader=SafeLoader)
             if isinstance(loaded, dict):
                 data = loaded
 
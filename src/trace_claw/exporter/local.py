@@ -2,22 +2,33 @@
 
 from __future__ import annotations
 
-import json
 import logging
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 
+from .. import _json
 from ..collector.base import MetricSample
 from ..config import LocalExporterConfig
 from .base import BaseExporter
 
 logger = logging.getLogger(__name__)
 
+# Writes are buffered in memory and pushed to disk at most this often (and
+# on day rollover / shutdown) instead of once per batch.
+_FLUSH_INTERVAL_S = 5.0
+_WRITE_BUFFER_BYTES = 64 * 1024
+
+# The UTC date is only re-read once the monotonic clock passes the next
+# midnight, or after this long so wall-clock steps are picked up too.
+_DATE_RECHECK_S = 60.0
 
 class LocalExporter(BaseExporter):
     """Writes metric samples to JSONL files on disk.
 
     One file per day is created inside the configured *output_dir*.
+    Output is buffered and flushed every few seconds, on rollover and on
+    :meth:`shutdown`, so a crash can lose the last few seconds of samples.
     """
 
     def __init__(self, config: LocalExporterConfig) -> None:
@@ -26,30 +37,45 @@ class LocalExporter(BaseExporter):
         self._output_dir.mkdir(parents=True, exist_ok=True)
         self._fh = None
         self._current_date: str | None = None
+        self._next_date_check = 0.0
+        self._last_flush = time.monotonic()
         logger.info("LocalExporter initialized → %s", self._output_dir)
 
     def _ensure_file(self) -> None:
-        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        mono = time.monotonic()
+        if mono < self._next_date_check and self._fh is not None:
+            return
+        now = datetime.now(timezone.utc)
+        today = now.strftime("%Y-%m-%d")
+        until_midnight = 86400.0 - (now.hour * 3600 + now.minute * 60 + now.second)
+        self._next_date_check = mono + min(until_midnight, _DATE_RECHECK_S)
         if self._current_date != today or self._fh is None:
             if self._fh is not None:
                 self._fh.close()
             filepath = self._output_dir / f"resources-{today}.jsonl"
-            self._fh = open(filepath, "a", encoding="utf-8")  # noqa: SIM115
+            self._fh = open(filepath, "ab", buffering=_WRITE_BUFFER_BYTES)  # noqa: SIM115
             self._current_date = today
 
     def export(self, samples: list[MetricSample]) -> None:
         self._ensure_file()
         assert self._fh is not None
-        for s in samples:
-            record = {
+        dumps = _json.dumps
+        records = [
+            dumps({
                 "name": s.name,
                 "value": s.value,
                 "unit": s.unit,
                 "timestamp": s.timestamp,
                 "labels": s.labels,
-            }
-            self._fh.write(json.dumps(record) + "\n")
-        self._fh.flush()
+            }, newline=True)
+            for s in samples
+        ]
+        # one joined chunk and one write() per batch
+        self._fh.write(b"".join(records))
+        mono = time.monotonic()
+        if mono - self._last_flush >= _FLUSH_INTERVAL_S:
+            self._fh.flush()
+            self._last_flush = mono
 
     def shutdown(self) -> None:
         if self._fh is not None:
@@ -12,6 +12,7 @@ from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
 from opentelemetry.sdk.resources import Resource, SERVICE_NAME
 
 from ..collector.base import MetricSample
+from ..collector.descriptions import METRIC_DESCRIPTIONS
 from ..config import OtelExporterConfig
 from .base import BaseExporter
 
@@ -44,6 +45,9 @@ class OtelExporter(BaseExporter):
         metrics.set_meter_provider(self._provider)
         self._meter = metrics.get_meter("trace_claw.resources")
         self._gauges: dict[str, Any] = {}
+        # metric name -> bound ``gauge.set``, so export() does one dict hit
+        # per sample instead of a method call plus an attribute lookup.
+        self._setters: dict[str, Any] = {}
 
         logger.info(
             "OtelExporter initialized → %s (service=%s)",
@@ -62,9 +66,13 @@ class OtelExporter(BaseExporter):
         return self._gauges[key]
 
     def export(self, samples: list[MetricSample]) -> None:
+        setters = self._setters
         for s in samples:
-            gauge = self._get_gauge(s.name, s.unit, s.description)
-            gauge.set(s.value, attributes=s.labels)
+            set_value = setters.get(s.name)
+            if set_value is None:
+                description = s.description or METRIC_DESCRIPTIONS.get(s.name, "")
+                set_value = setters[s.name] = self._get_gauge(s.name, s.unit, description).set
+            set_value(s.value, attributes=s.labels)
 
     def shutdown(self) -> None:
         self._provider.shutdown()
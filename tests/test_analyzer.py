@@ -7,16 +7,24 @@ from pathlib import Path
 from trace_claw.analyzer.parser import (
     OpenClawEvent,
     ResourceSample,
+    _iter_jsonl_bytes,
+    iter_trace_dir,
     load_trace_dir,
     parse_openclaw_log,
     parse_resource_file,
 )
 from trace_claw.analyzer.summary import (
+    _percentiles,
     save_summary,
     summarize_multi_session,
     summarize_session,
 )
-from trace_claw.analyzer.timeline import build_timeline, save_timeline
+from trace_claw.analyzer.timeline import (
+    build_timeline,
+    print_timeline,
+    save_timeline,
+    save_timeline_ndjson,
+)
 
 
 def _write_jsonl(path: Path, records: list[dict]) -> None:
@@ -46,6 +54,9 @@ def test_parse_openclaw_log():
     with tempfile.NamedTemporaryFile("w", suffix=".jsonl", delete=False) as fh:
         for rec in records:
             fh.write(json.dumps(rec) + "\n")
+        # plain log lines without an event-type key are skipped
+        fh.write(json.dumps({"level": "info", "msg": "gateway started"}) + "\n")
+        fh.write("not json at all\n")
         path = fh.name
 
     events = parse_openclaw_log(path)
@@ -54,6 +65,40 @@ def test_parse_openclaw_log():
     assert events[0].tokens_input == 100
     assert events[0].duration_ms == 1200
     assert events[1].event_type == "webhook.received"
+    assert events[0].raw is None
+
+    raw_events = parse_openclaw_log(path, keep_raw=True)
+    assert raw_events[0].raw["channel"] == "telegram"
+
+
+def test_parse_openclaw_log_string_timestamps():
+    records = [
+        {"type": "a", "timestamp": "1700000002.5"},
+        {"type": "b", "timestamp": "2023-11-14T22:13:20+00:00"},
+        {"type": "c", "timestamp": "yesterday"},
+    ]
+    with tempfile.NamedTemporaryFile("w", suffix=".jsonl", delete=False) as fh:
+        for rec in records:
+            fh.write(json.dumps(rec) + "\n")
+        path = fh.name
+
+    events = {e.event_type: e.timestamp for e in parse_openclaw_log(path)}
+    assert events == {"a": 1700000002.5, "b": 1700000000.0, "c": 0.0}
+
+
+def test_parse_openclaw_log_derives_missing_total():
+    records = [
+        {"type": "a", "timestamp": 1.0, "usage": {"input": 100, "output": 50}},
+        {"type": "b", "timestamp": 2.0, "usage": {"input": 100, "output": 50, "total": 200}},
+        {"type": "c", "timestamp": 3.0},
+    ]
+    with tempfile.NamedTemporaryFile("w", suffix=".jsonl", delete=False) as fh:
+        for rec in records:
+            fh.write(json.dumps(rec) + "\n")
+        path = fh.name
+
+    totals = {e.event_type: e.tokens_total for e in parse_openclaw_log(path)}
+    assert totals == {"a": 150, "b": 200, "c": 0}
 
 
 def test_parse_resource_file():
@@ -72,6 +117,35 @@ def test_parse_resource_file():
     assert samples[0].value == 45.0
 
 
+def test_parse_resource_file_shares_labels():
+    records = [
+        {"name": "process.cpu.usage_percent", "value": float(i), "unit": "%",
+         "timestamp": 1700000000.0 + i, "labels": {"pid": str(i % 2), "process_name": "node"}}
+        for i in range(4)
+    ]
+    records.append({"name": "odd", "value": 1.0, "unit": "", "timestamp": 0, "labels": {"tags": ["a"]}})
+    with tempfile.NamedTemporaryFile("w", suffix=".jsonl", delete=False) as fh:
+        for rec in records:
+            fh.write(json.dumps(rec) + "\n")
+        path = fh.name
+
+    samples = parse_resource_file(path)
+    assert [s.labels for s in samples] == [r["labels"] for r in records]
+    assert samples[0].labels is samples[2].labels
+    assert samples[1].labels is samples[3].labels
+    assert samples[0].labels is not samples[1].labels
+
+
+def test_iter_jsonl_bytes_chunk_boundaries():
+    with tempfile.NamedTemporaryFile("wb", suffix=".jsonl", delete=False) as fh:
+        fh.write(b'{"a": 1}\n\n  {"b": 2}  \r\n{"c": 3}')
+        path = Path(fh.name)
+
+    # a tiny buffer forces lines to straddle read() boundaries
+    lines = list(_iter_jsonl_bytes(path, bufsize=3))
+    assert lines == [b'{"a": 1}', b'{"b": 2}', b'{"c": 3}']
+
+
 def test_load_trace_dir():
     with tempfile.TemporaryDirectory() as tmpdir:
         tmppath = Path(tmpdir)
@@ -91,6 +165,28 @@ def test_load_trace_dir():
         assert len(resources) == 1
 
 
+def test_iter_trace_dir_chunks():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        _write_jsonl(tmppath / "resources-2024-01-01.jsonl", [
+            {"name": "system.cpu.usage_percent", "value": 10.0 * i, "unit": "%", "timestamp": 1700000000.0 + 2 * i, "labels": {"cpu": "total"}}
+            for i in range(3)
+        ])
+        _write_jsonl(tmppath / "resources-2024-01-02.jsonl", [
+            {"name": "system.cpu.usage_percent", "value": 5.0, "unit": "%", "timestamp": 1700000001.0 + 2 * i, "labels": {"cpu": "total"}}
+            for i in range(2)
+        ])
+        _write_jsonl(tmppath / "openclaw-events.jsonl", [
+            {"type": "model.usage", "timestamp": 1700000000.0},
+        ])
+
+        chunks = list(iter_trace_dir(tmppath, chunksize=2))
+        assert [len(r) for _, r in chunks] == [2, 2, 1]
+        assert [len(e) for e, _ in chunks] == [1, 0, 0]
+        timestamps = [r.timestamp for _, chunk in chunks for r in chunk]
+        assert timestamps == sorted(timestamps)
+
+
 def test_summarize_session():
     events = [
         OpenClawEvent(
@@ -126,6 +222,13 @@ def test_summarize_session():
     assert "claude-3" in summary.models_used
 
 
+def test_percentiles():
+    data = sorted([10.0, 40.0, 20.0, 30.0, 50.0])
+    assert _percentiles(data, (0, 50, 100)) == [10.0, 30.0, 50.0]
+    assert _percentiles(data, (95,)) == [48.0]
+    assert _percentiles([], (50, 95)) == [0.0, 0.0]
+
+
 def test_summarize_multi_session():
     events1 = [OpenClawEvent(timestamp=1700000000.0, event_type="model.usage", tokens_total=100, duration_ms=500)]
     events2 = [OpenClawEvent(timestamp=1700000010.0, event_type="model.usage", tokens_total=200, duration_ms=600)]
@@ -172,6 +275,37 @@ def test_save_timeline():
         assert len(data) == 1
 
 
+def test_save_timeline_ndjson():
+    events = [
+        OpenClawEvent(timestamp=1700000000.0, event_type="model.usage"),
+        OpenClawEvent(timestamp=1700000001.0, event_type="message.processed"),
+    ]
+    timeline = build_timeline(events, [])
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        out_path = Path(tmpdir) / "timeline.jsonl"
+        save_timeline_ndjson(timeline, out_path)
+        rows = [json.loads(line) for line in out_path.read_text().splitlines()]
+        assert [r["event_type"] for r in rows] == ["model.usage", "message.processed"]
+        assert rows[1]["relative_ms"] == 1000.0
+
+
+def test_print_timeline_plain(capsys):
+    events = [
+        OpenClawEvent(timestamp=1700000000.0 + i, event_type="model.usage")
+        for i in range(5)
+    ]
+    timeline = build_timeline(events, [])
+
+    # captured stdout is not a TTY, so the plain path is taken
+    print_timeline(timeline, max_rows=3)
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].split("\t")[:3] == ["Offset (ms)", "Category", "Event"]
+    assert len(lines) == 5
+    assert lines[1].split("\t")[2] == "model.usage"
+    assert lines[-1] == "  ... (2 more entries)"
+
+
 def test_save_summary():
     summary = summarize_session([], [])
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -1,9 +1,18 @@
 """Tests for the system resource collectors."""
 
+import json
+import os
+import threading
+import time
+
+import psutil
+import pytest
+
 from trace_claw.collector.base import BaseCollector, MetricSample
 from trace_claw.collector.cpu import CpuCollector
+from trace_claw.collector.descriptions import METRIC_DESCRIPTIONS
 from trace_claw.collector.memory import MemoryCollector
-from trace_claw.collector.network import NetworkCollector
+from trace_claw.collector.network import NetworkCollector, _parse_net_dev, _pread_all
 from trace_claw.collector.manager import CollectorManager
 from trace_claw.config import CollectorConfig
 
@@ -45,6 +54,55 @@ def test_network_collector():
     # rates may or may not appear depending on timing, but should not error
 
 
+def test_network_collector_single_interface():
+    ifaces = [i for i in psutil.net_io_counters(pernic=True) if i != "lo"]
+    if not ifaces:
+        pytest.skip("no network interface besides lo")
+    collector = NetworkCollector(interface=ifaces[0])
+    samples = collector.collect()
+    assert {s.labels["interface"] for s in samples} == {ifaces[0]}
+    totals = {s.name for s in samples}
+    assert totals == {"system.network.bytes_sent_total", "system.network.bytes_recv_total"}
+    if os.path.exists("/proc/net/dev"):
+        data = collector._read_net_dev()
+        assert collector._net_dev_fd is not None
+        assert [r[0] for r in _parse_net_dev(data, ifaces[0])] == [ifaces[0]]
+        # an unlisted interface falls back to all of them, as psutil does
+        every = {r[0] for r in _parse_net_dev(data)}
+        assert every == set(psutil.net_io_counters(pernic=True))
+        assert {r[0] for r in _parse_net_dev(data, "no-such-iface0")} == every
+    collector.close()
+    assert collector._net_dev_fd is None
+
+
+def test_pread_all_reads_past_short_reads(tmp_path):
+    path = tmp_path / "table"
+    path.write_bytes(b"".join(b"line %d\n" % i for i in range(1000)))
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        assert _pread_all(fd, bufsize=100) == path.read_bytes()
+    finally:
+        os.close(fd)
+
+    # procfs seq_files return about a page per read whatever the buffer
+    # size; smaps spans many pages, so a single pread() would truncate it
+    if not os.path.exists("/proc/self/smaps"):
+        return
+    fd = os.open("/proc/self/smaps", os.O_RDONLY)
+    try:
+        data = _pread_all(fd, bufsize=1 << 20)
+        assert len(os.pread(fd, 1 << 20, 0)) < len(data)
+    finally:
+        os.close(fd)
+    assert data.rstrip().splitlines()[-1].startswith(b"VmFlags")
+
+
+def test_metric_descriptions_cover_collectors():
+    for collector in (CpuCollector(), MemoryCollector(), NetworkCollector()):
+        for sample in collector.collect():
+            assert sample.name in METRIC_DESCRIPTIONS
+
+
 def test_collector_to_dict():
     collector = CpuCollector()
     samples = collector.collect()
@@ -52,6 +110,23 @@ def test_collector_to_dict():
     assert isinstance(dicts, list)
     assert all(isinstance(d, dict) for d in dicts)
     assert all("name" in d and "value" in d for d in dicts)
+    assert json.loads(collector.to_json_bytes(samples)) == dicts
+
+
+def test_legacy_collect_signature():
+    class LegacyCollector(BaseCollector):
+        @property
+        def name(self) -> str:
+            return "legacy"
+
+        def collect(self):
+            return [MetricSample("legacy.metric", 1.0, "1", 123.0, {})]
+
+    config = CollectorConfig(enabled=True, cpu=False, memory=False, network=False)
+    manager = CollectorManager(config)
+    manager._collectors.append(LegacyCollector())
+    samples = manager.collect_once()
+    assert [(s.name, s.timestamp) for s in samples] == [("legacy.metric", 123.0)]
 
 
 def test_collector_manager():
@@ -64,6 +139,8 @@ def test_collector_manager():
     # collect_once should work synchronously
     samples = manager.collect_once()
     assert len(samples) > 0
+    # every collector in a tick stamps the same timestamp
+    assert len({s.timestamp for s in samples}) == 1
 
     # verify sink is called
     manager.collect_once()
@@ -73,6 +150,64 @@ def test_collector_manager():
     assert len(collected) > 0
 
 
+def test_collector_manager_background_sinks():
+    config = CollectorConfig(enabled=True, interval_seconds=0.05, cpu=False, memory=True, network=False)
+    manager = CollectorManager(config)
+    batches = []
+    manager.add_sink(batches.append)
+    manager.start()
+    time.sleep(0.3)
+    manager.stop()
+    assert manager._sink_threads == []
+    # every queued batch is delivered before stop() returns
+    assert len(batches) >= 2
+    assert all(len(b) == 5 for b in batches)
+
+
+def test_collector_manager_slow_sink_does_not_block_others():
+    config = CollectorConfig(enabled=True, interval_seconds=0.05, cpu=False, memory=True, network=False)
+    manager = CollectorManager(config)
+    release = threading.Event()
+    slow_batches = []
+    fast_batches = []
+
+    def slow_sink(samples):
+        release.wait(5)
+        slow_batches.append(samples)
+
+    manager.add_sink(slow_sink)
+    manager.add_sink(fast_batches.append)
+    manager.start()
+    time.sleep(0.3)
+    assert len(fast_batches) >= 2
+    assert len(slow_batches) == 0
+    release.set()
+    assert manager.stop() == []
+    assert len(slow_batches) >= 1
+
+
+def test_collector_manager_stop_reports_unfinished_sinks(monkeypatch):
+    import trace_claw.collector.manager as manager_mod
+
+    monkeypatch.setattr(manager_mod, "_SINK_JOIN_TIMEOUT_S", 0.1)
+    config = CollectorConfig(enabled=True, interval_seconds=0.05, cpu=False, memory=True, network=False)
+    manager = CollectorManager(config)
+    release = threading.Event()
+    fast_batches = []
+
+    def stuck_sink(samples):
+        release.wait(5)
+
+    manager.add_sink(stuck_sink)
+    manager.add_sink(fast_batches.append)
+    manager.start()
+    time.sleep(0.2)
+    try:
+        assert manager.stop() == [stuck_sink]
+    finally:
+        release.set()
+
+
 def test_collector_manager_disabled():
     config = CollectorConfig(enabled=False)
     manager = CollectorManager(config)
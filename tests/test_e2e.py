@@ -22,6 +22,7 @@ from trace_claw.analyzer.parser import (
 )
 from trace_claw.analyzer.summary import save_summary, summarize_session
 from trace_claw.analyzer.timeline import build_timeline, save_timeline
+from trace_claw.cli import main as cli_main
 from trace_claw.collector.manager import CollectorManager
 from trace_claw.collector.process import ProcessCollector, find_pids_by_name
 from trace_claw.config import CollectorConfig, LocalExporterConfig, load_config
@@ -41,6 +42,24 @@ class TestProcessCollector:
         assert len(pids) > 0
         assert os.getpid() in pids
 
+    def test_find_pids_by_name_psutil_fallback(self, monkeypatch):
+        """The psutil scan finds the same process as the /proc fast path."""
+        import trace_claw.collector.process as process_mod
+
+        monkeypatch.setattr(process_mod, "_HAVE_PROC", False)
+        assert os.getpid() in find_pids_by_name("python")
+        assert find_pids_by_name("__nonexistent_process_xyz__") == []
+
+    def test_cmdline_arg0_matches_psutil_split(self):
+        """arg0 is split from the raw cmdline the way psutil splits it."""
+        from trace_claw.collector.process import _cmdline_arg0
+
+        assert _cmdline_arg0(b"/usr/bin/node\0server.js\0") == b"/usr/bin/node"
+        # title rewritten with spaces, with or without a trailing NUL
+        assert _cmdline_arg0(b"node: worker process") == b"node:"
+        assert _cmdline_arg0(b"node: worker process\0") == b"node:"
+        assert _cmdline_arg0(b"") == b""
+
     def test_find_pids_nonexistent(self):
         """Returns empty list for a process name that does not exist."""
         pids = find_pids_by_name("__nonexistent_process_xyz__")
@@ -85,6 +104,54 @@ class TestProcessCollector:
         # stale PID 999999 should be evicted
         assert 999999 not in collector._proc_cache
 
+    def test_process_collector_caches_pid_scan(self, monkeypatch):
+        """PIDs are rescanned only after the interval or when one exits."""
+        import trace_claw.collector.process as process_mod
+
+        scans = []
+        real_find = process_mod.find_pids_by_name
+
+        def counting_find(name):
+            scans.append(name)
+            return real_find(name)
+
+        monkeypatch.setattr(process_mod, "find_pids_by_name", counting_find)
+        collector = ProcessCollector("python", rescan_interval=60.0)
+        collector.collect()
+        collector.collect()
+        assert len(scans) == 1
+
+        # a tracked PID that is no longer running forces a rescan
+        collector._pids.append(999999)
+        collector.collect()
+        assert len(scans) == 2
+
+        # a cached Process whose PID was reused is dropped, not kept
+        stale_pid = collector._pids[0]
+        monkeypatch.setattr(collector._proc_cache[stale_pid], "is_running", lambda: False)
+        stale = collector._proc_cache[stale_pid]
+        collector.collect()
+        assert len(scans) == 3
+        assert collector._proc_cache.get(stale_pid) is not stale
+
+        collector = ProcessCollector("python", rescan_interval=0.0)
+        collector.collect()
+        collector.collect()
+        assert len(scans) == 5
+
+    def test_process_collector_cpu_min_interval(self):
+        """cpu_percent is not re-read for a PID within the minimum interval."""
+        collector = ProcessCollector("python", cpu_min_interval=60.0)
+        collector.collect()
+        pid = os.getpid()
+        proc = collector._proc_cache[pid]
+        calls = []
+        real_cpu_percent = proc.cpu_percent
+        proc.cpu_percent = lambda interval=None: calls.append(interval) or real_cpu_percent(interval)
+        collector.collect()
+        assert calls == []
+        assert pid in collector._last_cpu
+
     def test_collector_name(self):
         collector = ProcessCollector("python")
         assert collector.name == "process"
@@ -255,7 +322,7 @@ class TestE2ECollectAndAnalyze:
         with tempfile.TemporaryDirectory() as tmpdir:
             # Launch a subprocess that runs briefly
             proc = subprocess.Popen(
-                [sys.executable, "-c", "import time; time.sleep(5)"],
+                [sys.executable, "-I", "-S", "-c", "import time; time.sleep(5)"],
             )
             time.sleep(0.5)  # let it start
 
@@ -435,6 +502,7 @@ class TestCLIE2E:
     """Tests that exercise CLI commands end-to-end."""
 
     def test_cli_version(self):
+        # the one subprocess smoke test: covers ``python -m`` and argv wiring
         result = subprocess.run(
             [sys.executable, "-m", "trace_claw.cli", "version"],
             capture_output=True, text=True,
@@ -442,22 +510,21 @@ class TestCLIE2E:
         assert result.returncode == 0
         assert "trace_claw" in result.stdout
 
-    def test_cli_generate_config(self):
+    def test_cli_generate_config(self, capsys):
         with tempfile.TemporaryDirectory() as tmpdir:
             out_path = Path(tmpdir) / "test_openclaw.json"
-            result = subprocess.run(
-                [sys.executable, "-m", "trace_claw.cli", "generate-config", "-o", str(out_path)],
-                capture_output=True, text=True,
-            )
-            assert result.returncode == 0
+            assert cli_main(["generate-config", "-o", str(out_path)]) == 0
+            assert str(out_path) in capsys.readouterr().out
             assert out_path.exists()
             data = json.loads(out_path.read_text())
             assert data["diagnostics"]["otel"]["enabled"] is True
             assert data["plugins"]["allow"] == ["diagnostics-otel"]
 
-    def test_cli_analyze_with_data(self):
+    def test_cli_analyze_with_data(self, capsys, monkeypatch):
         with tempfile.TemporaryDirectory() as tmpdir:
             tmppath = Path(tmpdir)
+            # analysis output goes to ./trace_data/summary; keep it in tmpdir
+            monkeypatch.chdir(tmppath)
 
             # Write test data
             with open(tmppath / "openclaw-events.jsonl", "w") as fh:
@@ -478,25 +545,20 @@ class TestCLIE2E:
                     "timestamp": 1700000000.0, "labels": {"pid": "1234", "process_name": "node"},
                 }) + "\n")
 
-            result = subprocess.run(
-                [sys.executable, "-m", "trace_claw.cli", "analyze",
-                 "--trace-dir", str(tmppath), "--no-table"],
-                capture_output=True, text=True,
-            )
-            assert result.returncode == 0
-            assert "Model calls:" in result.stdout
-            assert "1" in result.stdout  # 1 model call
-            assert "session_summary.json" in result.stdout
+            assert cli_main(["analyze", "--trace-dir", str(tmppath), "--no-table"]) == 0
+            out = capsys.readouterr().out
+            assert "Model calls:" in out
+            assert "1" in out  # 1 model call
+            assert "session_summary.json" in out
 
-    def test_cli_analyze_empty_dir(self):
+    def test_cli_analyze_empty_dir(self, capsys):
         with tempfile.TemporaryDirectory() as tmpdir:
-            result = subprocess.run(
-                [sys.executable, "-m", "trace_claw.cli", "analyze",
-                 "--trace-dir", str(tmpdir), "--no-table"],
-                capture_output=True, text=True,
-            )
-            assert result.returncode == 0
-            assert "No trace data found" in result.stdout
+            assert cli_main(["analyze", "--trace-dir", str(tmpdir), "--no-table"]) == 0
+            assert "No trace data found" in capsys.readouterr().out
+
+    def test_cli_no_command(self, capsys):
+        assert cli_main([]) == 1
+        assert "usage: trace-claw" in capsys.readouterr().out
 
 
 # ---------------------------------------------------------------------------